@@ -0,0 +1,93 @@
+"""
+Helpers shared by analyze_deps.py and analyze_project.py.
+"""
+
+import os
+import json
+import mmap
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Dependency, VCS and build-output directories, pruned without being listed
+SKIP_DIRS = frozenset({"node_modules", ".git", "dist", "build", ".next"})
+
+def walk(root: Path, extensions: tuple[str, ...]):
+    """Yield paths of files under root with the given extensions, skipping SKIP_DIRS."""
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith(extensions) and entry.is_file():
+                        yield entry.path
+        except OSError:
+            continue
+
+def path_prefix(root: Path) -> str:
+    """Return root plus a separator, for slicing walk() paths to relative ones."""
+    # Cheaper than building Path objects for relative_to()
+    return os.path.join(str(root), "")
+
+# Files are read up to this size; anything larger is a generated bundle or map
+# where scanning the full content rarely finds components worth reporting
+_MAX_READ_BYTES = 512 * 1024
+
+# Read first; the rest of a longer file is searched in place through mmap, so
+# it is only copied into memory if it can contain a component
+_MMAP_MIN_BYTES = 256 * 1024
+
+def read_source(path: str) -> bytes:
+    """Read up to _MAX_READ_BYTES of a file; b"" for large non-component files.
+    
+    Not cached: each script run is its own process, so there is no earlier
+    read to reuse.
+    """
+    with open(path, "rb") as f:
+        data = f.read(_MMAP_MIN_BYTES)
+        # A short read means the file is small and already complete
+        if len(data) < _MMAP_MIN_BYTES:
+            return data
+        # A keyword in the part already read: just read the rest of the prefix
+        if b"return" in data or b"extends" in data:
+            return data + f.read(_MAX_READ_BYTES - _MMAP_MIN_BYTES)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Search only the unread part, overlapping by len("extends") - 1
+            # bytes so a keyword split across the boundary is still found
+            start = _MMAP_MIN_BYTES - 6
+            if (mm.find(b"return", start, _MAX_READ_BYTES) == -1
+                    and mm.find(b"extends", start, _MAX_READ_BYTES) == -1):
+                return b""
+            return data + mm[_MMAP_MIN_BYTES:_MAX_READ_BYTES]
+
+# Below this many files per worker, pool start-up outweighs the parallel gain
+_MIN_FILES_PER_WORKER = 16
+
+def _worker_count() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+def map_files(func, files: list):
+    """Lazily apply func to each file, across a process pool for large trees."""
+    workers = _worker_count()
+    # A single CPU gains nothing from worker processes, only start-up and IPC
+    if workers <= 1 or len(files) < workers * _MIN_FILES_PER_WORKER:
+        yield from map(func, files)
+        return
+    chunksize = min(64, len(files) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(func, files, chunksize=chunksize)
+
+def dump_json(result: dict) -> str:
+    """Serialize a result as indented JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(result, indent=2, ensure_ascii=False)
@@ -6,77 +6,159 @@ Usage: python analyze_deps.py <project_path>
 
 import os
 import sys
-import json
-import re
+try:
+    # RE2 guarantees linear-time matching on large generated/minified files
+    import re2 as re
+except ImportError:
+    import re
 from pathlib import Path
-from collections import defaultdict
+from collections import OrderedDict
+from functools import partial
+from hashlib import blake2b
+from itertools import islice
 
-def extract_imports(content: str) -> list[str]:
-    """Extract imported component names from file content."""
-    imports = []
+from _common import dump_json, map_files, path_prefix, read_source, walk
+
+# Single-pass scanner: one alternation covering imports and component detection.
+#   imp: import X from './Component' / import { X, Y } from './components'
+#   cls: class X extends (React.)Component
+#   fn/ret: a function/const declaration followed later by return <...
+#           (fn stops before the declared name: consuming it would swallow a
+#           "return"/"class" that follows a comment ending in function/const)
+_COMBINED_RE = re.compile(
+    r"(?P<imp>import\s+(?:{(?P<named>[^}]+)}|(?P<default>\w+))\s+from\s+['\"](?P<source>[^'\"]+)['\"])"
+    r"|(?P<cls>class\s+\w+\s+extends\s+(?:React\.)?Component)"
+    r"|(?P<fn>(?:function|const)\s+)"
+    r"|(?P<ret>return\s*\(?\s*<)"
+)
+
+# Match <ComponentName or <Component.Sub
+# Kept out of the alternation above: on its own the leading literal "<" lets
+# the engine skip ahead between tags, which is faster than both the fused
+# alternation and a str.find-driven Python scanner
+_JSX_RE = re.compile(r"<([A-Z][a-zA-Z0-9]*(?:\.[A-Z][a-zA-Z0-9]*)?)")
+
+# Match: function Component({ prop1, prop2 })
+# The name is captured rather than substituted, so one compiled pattern
+# serves every component
+_PROPS_RE = re.compile(r"(?:function|const)\s+(\w+)\s*[=:]?\s*(?:\([^)]*\)\s*=>)?\s*\(?\s*\{\s*([^}]+)\s*\}")
+
+def scan_content(content: str) -> dict | None:
+    """Extract imports and JSX children; None if not a React component.
+    
+    A declaration keyword ending a comment must not hide the code after it:
     
-    # Match: import X from './Component'
-    # Match: import { X, Y } from './components'
-    pattern = r"import\s+(?:{([^}]+)}|(\w+))\s+from\s+['\"]([^'\"]+)['\"]"
+    >>> scan_content("export default function App() { // leave as const\\n return <Main /> }")["jsx_children"]
+    {'Main'}
+    >>> scan_content("// TODO: convert to a function\\nclass Legacy extends React.Component {}") is not None
+    True
+    """
+    imports = []
+    seen_decl = False
+    is_component = False
     
-    for match in re.finditer(pattern, content):
-        named = match.group(1)
-        default = match.group(2)
-        path = match.group(3)
+    for match in _COMBINED_RE.finditer(content):
+        kind = match.lastgroup
         
-        # Skip external packages
-        if not path.startswith("."):
-            continue
+        if kind == "imp":
+            # Skip external packages
+            if not match.group("source").startswith("."):
+                continue
             
-        if named:
-            imports.extend([n.strip().split(" as ")[0] for n in named.split(",")])
-        if default:
-            imports.append(default)
+            named = match.group("named")
+            default = match.group("default")
+            if named:
+                imports.extend([n.strip().split(" as ")[0] for n in named.split(",")])
+            if default:
+                imports.append(default)
+        elif kind == "fn":
+            # Only a declaration if a name follows, matching the old \w+
+            end = match.end()
+            if end < len(content) and (content[end].isalnum() or content[end] == "_"):
+                seen_decl = True
+        elif kind == "ret":
+            is_component = is_component or seen_decl
+        elif kind == "cls":
+            is_component = True
+    
+    if not is_component:
+        return None
     
-    return imports
-
-def extract_jsx_components(content: str) -> list[str]:
-    """Extract JSX component usage from file content."""
-    # Match <ComponentName or <Component.Sub
-    pattern = r"<([A-Z][a-zA-Z0-9]*(?:\.[A-Z][a-zA-Z0-9]*)?)"
-    matches = re.findall(pattern, content)
-    return list(set(matches))
+    jsx_children = set(_JSX_RE.findall(content))
+    return {"imports": imports, "jsx_children": jsx_children}
 
 def extract_props(content: str, component_name: str) -> list[str]:
     """Extract props received by a component."""
     props = []
     
-    # Match: function Component({ prop1, prop2 })
-    pattern = rf"(?:function|const)\s+{component_name}\s*[=:]?\s*(?:\([^)]*\)\s*=>)?\s*\(?\s*\{{\s*([^}}]+)\s*\}}"
-    match = re.search(pattern, content)
-    
-    if match:
-        props_str = match.group(1)
+    for match in _PROPS_RE.finditer(content):
+        if match.group(1) != component_name:
+            continue
+        
+        props_str = match.group(2)
         props = [p.strip().split("=")[0].split(":")[0].strip() 
                  for p in props_str.split(",") if p.strip()]
+        break
     
     return props
 
-def analyze_file(file_path: Path, base_path: Path) -> dict | None:
-    """Analyze a single React file."""
+# Entry points that are expected to have no parent component
+_ORPHAN_EXEMPT = frozenset({"App", "index", "main", "Root"})
+
+# Content-derived analysis keyed by (content digest, file stem), so duplicate
+# files (generated components, re-export index files) are only parsed once;
+# least recently used entries are evicted beyond _ANALYSIS_CACHE_SIZE
+_ANALYSIS_CACHE_SIZE = 4096
+_analysis_cache: OrderedDict[tuple[bytes, str], dict | None] = OrderedDict()
+
+def _analyze_bytes(data: bytes, stem: str) -> dict | None:
+    """Analyze raw file content, memoized by content hash.
+    
+    The cache is per process: duplicates handled by different pool
+    workers are each parsed once per worker.
+    """
+    key = (blake2b(data, digest_size=16).digest(), stem)
+    if key in _analysis_cache:
+        _analysis_cache.move_to_end(key)
+        return _analysis_cache[key]
+    
+    content = data.decode("utf-8", errors="ignore")
+    result = None
+    
+    scanned = scan_content(content)
+    if scanned is not None:
+        result = {
+            "imports": scanned["imports"],
+            "jsx_children": scanned["jsx_children"],
+            "props": extract_props(content, stem)
+        }
+    
+    _analysis_cache[key] = result
+    if len(_analysis_cache) > _ANALYSIS_CACHE_SIZE:
+        _analysis_cache.popitem(last=False)
+    return result
+
+def analyze_file(file_path: str, base_prefix: str) -> dict | None:
+    """Analyze a single React file; base_prefix is the project path plus a separator."""
     try:
-        content = file_path.read_text(encoding="utf-8", errors="ignore")
+        data = read_source(file_path)
     except:
         return None
     
-    # Check if it's a React component
-    if not re.search(r"(function|const)\s+\w+.*?return\s*\(?\s*<", content, re.DOTALL):
-        if not re.search(r"class\s+\w+\s+extends\s+(React\.)?Component", content):
-            return None
+    # Check if it's a React component (cheap substring check first)
+    if b"return" not in data and b"extends" not in data:
+        return None
+    
+    name = os.path.splitext(os.path.basename(file_path))[0]
     
-    name = file_path.stem
+    analysis = _analyze_bytes(data, name)
+    if analysis is None:
+        return None
     
     return {
         "name": name,
-        "path": str(file_path.relative_to(base_path)),
-        "imports": extract_imports(content),
-        "jsx_children": extract_jsx_components(content),
-        "props": extract_props(content, name)
+        "path": file_path[len(base_prefix):],
+        **analysis
     }
 
 def build_dependency_graph(project_path: str) -> dict:
@@ -87,23 +169,34 @@ def build_dependency_graph(project_path: str) -> dict:
         return {"error": f"Path not found: {project_path}"}
     
     components = {}
-    extensions = [".tsx", ".jsx"]
-    
-    for ext in extensions:
-        for file in path.rglob(f"*{ext}"):
-            if "node_modules" in str(file):
-                continue
-            
-            analysis = analyze_file(file, path)
-            if analysis:
-                components[analysis["name"]] = analysis
     
-    # Build usage map
-    usage_map = defaultdict(list)
+    base_prefix = path_prefix(path)
+    files = list(walk(path, (".tsx", ".jsx")))
+    
+    for analysis in map_files(partial(analyze_file, base_prefix=base_prefix), files):
+        if analysis:
+            # Component names recur as dict keys, children and used_by
+            # entries; interning once here, after results are back from any
+            # pool workers, lets them all share one string object
+            name = analysis["name"] = sys.intern(analysis["name"])
+            analysis["jsx_children"] = {sys.intern(c) for c in analysis["jsx_children"]}
+            components[name] = analysis
+    
+    component_names = frozenset(components)
+    
+    # Build usage map, preallocated for every referenced component
+    referenced = set()
+    for data in components.values():
+        referenced.update(data["jsx_children"])
+    usage_map = {child: [] for child in referenced & component_names}
+    # Components gaining their second user are shared; record them as we go
+    shared = []
     for name, data in components.items():
-        for child in data["jsx_children"]:
-            if child in components:
-                usage_map[child].append(name)
+        for child in data["jsx_children"] & component_names:
+            users = usage_map[child]
+            users.append(name)
+            if len(users) == 2:
+                shared.append(child)
     
     # Detect issues
     issues = []
@@ -120,7 +213,7 @@ def build_dependency_graph(project_path: str) -> dict:
     
     # Orphan detection
     for name, data in components.items():
-        if name not in usage_map and name not in ["App", "index", "main", "Root"]:
+        if name not in usage_map and name not in _ORPHAN_EXEMPT:
             issues.append({
                 "type": "orphan_component",
                 "location": data["path"],
@@ -132,16 +225,15 @@ def build_dependency_graph(project_path: str) -> dict:
         "components": [
             {
                 "name": name,
-                "children": [c for c in data["jsx_children"] if c in components],
+                "children": list(data["jsx_children"] & component_names),
                 "props_received": data["props"],
                 "used_by": usage_map.get(name, [])
             }
-            for name, data in list(components.items())[:30]
+            for name, data in islice(components.items(), 30)
         ],
         "shared_components": [
-            {"name": name, "used_by": users}
-            for name, users in usage_map.items()
-            if len(users) > 1
+            {"name": name, "used_by": usage_map[name]}
+            for name in shared
         ],
         "issues": issues
     }
@@ -154,4 +246,4 @@ if __name__ == "__main__":
         sys.exit(1)
     
     result = build_dependency_graph(sys.argv[1])
-    print(json.dumps(result, indent=2, ensure_ascii=False))
+    print(dump_json(result))
@@ -7,9 +7,24 @@ Usage: python analyze_project.py <project_path>
 import os
 import sys
 import json
-import re
+try:
+    # RE2 guarantees linear-time matching on large generated/minified files
+    import re2 as re
+except ImportError:
+    import re
 from pathlib import Path
+from typing import Iterator
 from collections import defaultdict
+from functools import partial
+
+from _common import dump_json, map_files, path_prefix, read_source, walk
+
+# Limit output: only this many components are listed, all are counted
+_MAX_LISTED_COMPONENTS = 20
+
+# Inline (?s) rather than re.DOTALL: RE2 takes options, not flags
+_FUNC_RE = re.compile(r"(?s)(function|const)\s+\w+.*?return\s*\(?\s*<")
+_CLASS_RE = re.compile(r"class\s+\w+\s+extends\s+(React\.)?Component")
 
 def find_package_json(path: Path) -> dict | None:
     pkg_path = path / "package.json"
@@ -56,37 +71,39 @@ def detect_styling(pkg: dict) -> str:
         return "sass"
     return "css_modules"
 
-def find_components(path: Path) -> list[dict]:
-    components = []
-    extensions = [".tsx", ".jsx", ".ts", ".js"]
+def _detect_component(file_path: str, base_prefix: str) -> dict | None:
+    file_name = os.path.basename(file_path)
+    if file_name.startswith("."):
+        return None
+        
+    try:
+        data = read_source(file_path)
+    except:
+        return None
+        
+    # Detect React components (cheap substring check first)
+    if b"return" not in data and b"extends" not in data:
+        return None
+    content = data.decode("utf-8", errors="ignore")
+    if _FUNC_RE.search(content):
+        component_type = "functional"
+    elif _CLASS_RE.search(content):
+        component_type = "class"
+    else:
+        return None
     
-    for ext in extensions:
-        for file in path.rglob(f"*{ext}"):
-            if "node_modules" in str(file):
-                continue
-            if file.name.startswith("."):
-                continue
-                
-            try:
-                content = file.read_text(encoding="utf-8", errors="ignore")
-            except:
-                continue
-                
-            # Detect React components
-            if re.search(r"(function|const)\s+\w+.*?return\s*\(?\s*<", content, re.DOTALL):
-                components.append({
-                    "name": file.stem,
-                    "path": str(file.relative_to(path)),
-                    "type": "functional"
-                })
-            elif re.search(r"class\s+\w+\s+extends\s+(React\.)?Component", content):
-                components.append({
-                    "name": file.stem,
-                    "path": str(file.relative_to(path)),
-                    "type": "class"
-                })
-    
-    return components
+    return {
+        "name": os.path.splitext(file_name)[0],
+        "path": file_path[len(base_prefix):],
+        "type": component_type
+    }
+
+def find_components(path: Path) -> Iterator[dict]:
+    base_prefix = path_prefix(path)
+    files = list(walk(path, (".tsx", ".jsx", ".ts", ".js")))
+    for component in map_files(partial(_detect_component, base_prefix=base_prefix), files):
+        if component:
+            yield component
 
 def analyze_project(project_path: str) -> dict:
     path = Path(project_path)
@@ -98,7 +115,13 @@ def analyze_project(project_path: str) -> dict:
     if not pkg:
         return {"error": "package.json not found"}
     
-    components = find_components(path)
+    # Count every component but only keep the ones that are output
+    component_count = 0
+    components = []
+    for component in find_components(path):
+        component_count += 1
+        if len(components) < _MAX_LISTED_COMPONENTS:
+            components.append(component)
     
     # Determine project type
     project_type = "spa"
@@ -111,8 +134,8 @@ def analyze_project(project_path: str) -> dict:
         "framework": framework,
         "state_management": detect_state_management(pkg),
         "styling": detect_styling(pkg),
-        "component_count": len(components),
-        "components": components[:20],  # Limit output
+        "component_count": component_count,
+        "components": components,
         "dependencies": list(pkg.get("dependencies", {}).keys())[:15]
     }
     
@@ -124,4 +147,4 @@ if __name__ == "__main__":
         sys.exit(1)
     
     result = analyze_project(sys.argv[1])
-    print(json.dumps(result, indent=2, ensure_ascii=False))
+    print(dump_json(result))